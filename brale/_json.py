@@ -0,0 +1,28 @@
+"""JSON helpers with an optional orjson fast path.
+
+orjson parses and serializes API payloads several times faster than the
+stdlib, but the CLI stays dependency-light: if it isn't installed we fall
+back to the stdlib `json` module with the same interface.
+"""
+
+try:
+    import orjson
+
+    def loads(data):
+        """Parse JSON from bytes or str."""
+        return orjson.loads(data)
+
+    def dumps(obj, indent=False) -> str:
+        """Serialize an object to a JSON string."""
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0).decode()
+
+except ImportError:
+    import json
+
+    def loads(data):
+        """Parse JSON from bytes or str."""
+        return json.loads(data)
+
+    def dumps(obj, indent=False) -> str:
+        """Serialize an object to a JSON string."""
+        return json.dumps(obj, indent=2 if indent else None)
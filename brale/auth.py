@@ -1,18 +1,48 @@
 """Authentication module for Brale CLI."""
 
-import base64
+import binascii
+import hashlib
+import os
 import time
 from typing import Optional, Dict, Any
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from .config import config
 
+# Treat tokens expiring within this window as already expired so we never
+# send a request with a token that dies mid-flight.
+TOKEN_EXPIRY_MARGIN = 60
+
+# Cached GET bodies live here; they can contain account data (wire and
+# bank details), so the directory is private and logout() clears it.
+_HTTP_CACHE_DIR = config.config_dir / 'http_cache'
+
+def _client_fingerprint(client_id, client_secret) -> str:
+    """Stable hash identifying a credential pair (never stored in clear)."""
+    return hashlib.sha256(f"{client_id}:{client_secret}".encode()).hexdigest()
+
 class BraleAuth:
     """Authentication manager for Brale API."""
-    
+
     def __init__(self):
         self.auth_base_url = config.get_auth_base_url()
         self.api_base_url = config.get_api_base_url()
-    
+        self._token_endpoint = self.auth_base_url + "/oauth2/token"
+        # Reuse one session so repeated token requests share a pooled
+        # keep-alive connection instead of a fresh TCP+TLS handshake.
+        self.session = requests.Session()
+        # Cache of Basic-auth headers keyed by credential pair, so the
+        # 401-refresh path doesn't re-encode on every authenticate().
+        self._basic_auth_cache = {}
+        # Expiry of the current token, primed lazily from config so
+        # is_authenticated() doesn't hit credential lookups per call.
+        # None = not primed; inf = token stored without an expiry.
+        self._cached_expires_at: Optional[float] = None
+        # Whether the stored token matches the active credentials;
+        # checked at most once per process (None = not yet checked).
+        self._fingerprint_ok: Optional[bool] = None
+
     def authenticate(self, client_id: Optional[str] = None, client_secret: Optional[str] = None) -> bool:
         """Authenticate with Brale API using client credentials."""
         # Get credentials from parameters or config/env
@@ -22,15 +52,22 @@ class BraleAuth:
         if not client_id or not client_secret:
             raise ValueError("Client ID and secret are required. Set them via environment variables or config.")
         
-        # Create basic auth header
-        credentials = base64.b64encode(f"{client_id}:{client_secret}".encode()).decode()
-        
+        # Create basic auth header (memoized per credential pair)
+        basic_auth = self._basic_auth_cache.get((client_id, client_secret))
+        if basic_auth is None:
+            # b2a_base64 is the direct C entry point (b64encode wraps it)
+            credentials = binascii.b2a_base64(
+                f"{client_id}:{client_secret}".encode('ascii'), newline=False
+            ).decode('ascii')
+            basic_auth = f"Basic {credentials}"
+            self._basic_auth_cache[(client_id, client_secret)] = basic_auth
+
         # Make token request
         try:
-            response = requests.post(
-                f"{self.auth_base_url}/oauth2/token",
+            response = self.session.post(
+                self._token_endpoint,
                 headers={
-                    "Authorization": f"Basic {credentials}",
+                    "Authorization": basic_auth,
                     "Content-Type": "application/x-www-form-urlencoded"
                 },
                 data={"grant_type": "client_credentials"}
@@ -46,9 +83,18 @@ class BraleAuth:
             
             # Store token and credentials
             config.set_access_token(access_token, expires_at)
+            self._cached_expires_at = expires_at
             config.set_credential('client_id', client_id)
             config.set_credential('client_secret', client_secret)
-            
+            # Tag the token with the credentials that minted it so a
+            # later credential switch can't reuse it
+            config.set_credential(
+                'client_fingerprint', _client_fingerprint(client_id, client_secret)
+            )
+            self._fingerprint_ok = True
+            # Fresh tokens are too valuable to leave to the atexit flush
+            config.flush()
+
             return True
             
         except requests.RequestException as e:
@@ -56,21 +102,42 @@ class BraleAuth:
     
     def is_authenticated(self) -> bool:
         """Check if we have a valid access token."""
-        token = config.get_access_token()
-        if not token:
-            return False
-        
-        # Check if token is expired
-        expires_at = config.get_credential('token_expires_at')
-        if expires_at and int(time.time()) >= expires_at:
+        if self._cached_expires_at is None:
+            token = config.get_access_token()
+            if not token:
+                return False
+            # Tokens persisted without an expiry are treated as non-expiring
+            self._cached_expires_at = config.get_credential('token_expires_at') or float('inf')
+
+        # Check if token is expired (with a safety margin)
+        if time.time() >= self._cached_expires_at - TOKEN_EXPIRY_MARGIN:
+            self._cached_expires_at = None
             config.clear_access_token()
             return False
-        
+
         return True
     
+    def _token_matches_credentials(self) -> bool:
+        """True when the stored token was minted for the active credentials.
+
+        Guards against replaying a cached token after BRALE_CLIENT_ID /
+        BRALE_SECRET change between invocations. Tokens stored before
+        fingerprinting existed are trusted as-is.
+        """
+        if self._fingerprint_ok is None:
+            stored = config.get_credential('client_fingerprint')
+            if stored is None:
+                self._fingerprint_ok = True
+            else:
+                client_id, client_secret = config.get_client_credentials()
+                self._fingerprint_ok = (
+                    _client_fingerprint(client_id, client_secret) == stored
+                )
+        return self._fingerprint_ok
+
     def get_access_token(self) -> Optional[str]:
         """Get current access token, refreshing if necessary."""
-        if not self.is_authenticated():
+        if not self.is_authenticated() or not self._token_matches_credentials():
             # Try to refresh token automatically
             try:
                 client_id, client_secret = config.get_client_credentials()
@@ -85,7 +152,12 @@ class BraleAuth:
     
     def logout(self):
         """Clear stored authentication data."""
+        import shutil
+        self._cached_expires_at = None
+        self._fingerprint_ok = None
         config.clear_access_token()
+        # Cached responses hold account data; drop them with the token
+        shutil.rmtree(_HTTP_CACHE_DIR, ignore_errors=True)
         # Note: We keep client credentials for easy re-authentication
     
     def get_auth_headers(self) -> Dict[str, str]:
@@ -99,26 +171,98 @@ class BraleAuth:
 class BraleAPIClient:
     """API client with automatic authentication."""
     
-    def __init__(self):
-        self.auth = BraleAuth()
+    def __init__(self, auth: Optional[BraleAuth] = None):
+        self.auth = auth or BraleAuth()
         self.base_url = config.get_api_base_url()
-        self.session = requests.Session()
+        # Share the auth session so token and API requests draw from one
+        # pool (urllib3 keys pools by host inside a single Session, so
+        # auth.brale.xyz and api.brale.xyz each keep their own sockets).
+        self.session = self.auth.session
+        # Size the connection pool for bursty CLI workloads and retry
+        # transient failures with backoff instead of surfacing them.
+        adapter = HTTPAdapter(
+            pool_connections=8,
+            pool_maxsize=32,
+            max_retries=Retry(
+                total=3,
+                backoff_factor=0.2,
+                status_forcelist=[429, 500, 502, 503, 504],
+                allowed_methods=["GET", "POST", "PUT", "DELETE"]
+            )
+        )
+        self.session.mount("https://", adapter)
+        # Expiry of the token currently set on session headers; lets the
+        # per-request path skip config lookups until a refresh is due.
+        self._token_expires_at: Optional[int] = None
+        # Endpoint -> full URL cache; CLI flows hit the same account
+        # scoped endpoints repeatedly (list, then per-item detail).
+        self._url_cache: Dict[str, str] = {}
+        # On-disk ETag cache for GETs; revalidated responses (304) are
+        # served from here without re-downloading the body.
+        self._http_cache_dir = _HTTP_CACHE_DIR
+
+    def _cached_response(self, url):
+        """Return (cache_path, etag, body) for a GET URL, best effort."""
+        path = self._http_cache_dir / hashlib.sha256(url.encode()).hexdigest()
+        try:
+            raw = path.read_bytes()
+            etag, body = raw.split(b'\n', 1)
+            return path, etag.decode('ascii'), body
+        except Exception:
+            return path, None, None
+
+    def _store_cached_response(self, path, etag, body):
+        """Persist an ETag + body pair; cache failures are non-fatal."""
+        try:
+            # Owner-only: cached bodies can include bank/routing details
+            self._http_cache_dir.mkdir(mode=0o700, exist_ok=True)
+            path.write_bytes(etag.encode('ascii') + b'\n' + body)
+            os.chmod(path, 0o600)
+        except Exception:
+            pass
     
     def _ensure_authenticated(self):
-        """Ensure we have valid authentication."""
-        if not self.auth.is_authenticated():
+        """Ensure we have valid authentication, refreshing proactively."""
+        # Fast path: the session header is already set and the token is
+        # comfortably inside its lifetime, so skip the config lookups.
+        if self._token_expires_at and time.time() < self._token_expires_at - TOKEN_EXPIRY_MARGIN:
+            return
+
+        # get_access_token() re-authenticates when the stored token is
+        # missing or inside the expiry margin, so tokens refresh before
+        # a request goes out instead of after a wasted 401 round-trip.
+        token = self.auth.get_access_token()
+        if not token:
             raise RuntimeError("Not authenticated. Run 'brale auth login' first.")
-        
-        # Update session headers
-        self.session.headers.update(self.auth.get_auth_headers())
+
+        self._set_bearer_token(token)
+
+    def _set_bearer_token(self, token: str):
+        """Install a bearer token on the session and cache its expiry."""
+        self.session.headers["Authorization"] = f"Bearer {token}"
+        self._token_expires_at = config.get_credential('token_expires_at')
     
     def request(self, method: str, endpoint: str, **kwargs) -> requests.Response:
         """Make authenticated API request."""
         self._ensure_authenticated()
         
-        url = f"{self.base_url}{endpoint}"
+        url = self._url_cache.get(endpoint)
+        if url is None:
+            url = self._url_cache[endpoint] = self.base_url + endpoint
+
+        # Revalidate GETs against the on-disk ETag cache; a 304 costs a
+        # round-trip but skips re-downloading (and re-parsing) the body.
+        # The cache is keyed on the bare URL, so skip it when params
+        # would change the effective URL after the key is computed.
+        use_cache = method == 'GET' and 'params' not in kwargs
+        cache_path = cached_body = None
+        if use_cache:
+            cache_path, etag, cached_body = self._cached_response(url)
+            if etag is not None:
+                kwargs.setdefault('headers', {}).setdefault('If-None-Match', etag)
+
         response = self.session.request(method, url, **kwargs)
-        
+
         # Handle token expiration
         if response.status_code == 401:
             # Try to refresh token and retry once
@@ -126,13 +270,39 @@ class BraleAPIClient:
                 client_id, client_secret = config.get_client_credentials()
                 if client_id and client_secret:
                     self.auth.authenticate(client_id, client_secret)
-                    self.session.headers.update(self.auth.get_auth_headers())
+                    self._set_bearer_token(config.get_access_token())
                     response = self.session.request(method, url, **kwargs)
             except Exception:
                 pass  # If refresh fails, return original 401 response
-        
+
+        # Cache handling runs after the 401 retry so a 304 on either
+        # attempt gets its body substituted before callers see it
+        if use_cache:
+            if response.status_code == 304 and cached_body is not None:
+                # Substitute the cached body so callers see a normal 200
+                response.status_code = 200
+                response._content = cached_body
+            elif response.status_code == 200 and 'ETag' in response.headers:
+                self._store_cached_response(cache_path, response.headers['ETag'], response.content)
+
         return response
     
+    def poll_until(self, endpoint: str, predicate, timeout: float = 60.0) -> requests.Response:
+        """Poll a GET endpoint until predicate(response) is truthy or timeout.
+
+        Polls aggressively at first (200ms) and backs off exponentially to a
+        1s cap, reusing the pooled session connection for each attempt. Once
+        Brale exposes webhooks this should become event-driven instead.
+        """
+        deadline = time.time() + timeout
+        interval = 0.2
+        while True:
+            response = self.get(endpoint)
+            if predicate(response) or time.time() >= deadline:
+                return response
+            time.sleep(interval)
+            interval = min(interval * 1.5, 1.0)
+
     def get(self, endpoint: str, **kwargs) -> requests.Response:
         """Make GET request."""
         return self.request('GET', endpoint, **kwargs)
@@ -149,6 +319,6 @@ class BraleAPIClient:
         """Make DELETE request."""
         return self.request('DELETE', endpoint, **kwargs)
 
-# Global instances
+# Global instances (share one BraleAuth so refreshes are visible to both)
 auth = BraleAuth()
-api_client = BraleAPIClient()
\ No newline at end of file
+api_client = BraleAPIClient(auth)
\ No newline at end of file
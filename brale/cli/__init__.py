@@ -0,0 +1,221 @@
+"""Brale CLI - Command-line interface for the Brale API."""
+
+import importlib
+import sys
+from functools import lru_cache
+import click
+from rich.console import Console
+from rich.panel import Panel
+from rich.text import Text
+from .. import _json
+from ..config import config as brale_config
+
+console = Console()
+
+@lru_cache(maxsize=1)
+def _default_account():
+    """Default account ID, cached for the life of the process.
+
+    Commands may consult it several times per invocation; invalidate
+    with _default_account.cache_clear() after changing the default.
+    """
+    return brale_config.get_default_account()
+
+def _find_compatible_address(addresses, network):
+    """Pick an active address for the requested network in one pass.
+
+    Builds a network -> address map over the active addresses, so the
+    lookup, the auto-select fallback (first active address's first
+    network when none was requested) and the available-network list for
+    error reporting all come from a single scan.
+
+    Returns (address, network, available_networks); address is None
+    when nothing matches.
+    """
+    by_net = {}
+    for addr in addresses:
+        if addr['status'] != 'active':
+            continue
+        for net in addr.get('transfer_types', ()):
+            by_net.setdefault(net, addr)
+    if network is None and by_net:
+        network = next(iter(by_net))
+    return by_net.get(network), network, list(by_net)
+
+def _trunc(s, head, tail=None):
+    """Truncate a string for display: keep the head (and optional tail).
+
+    Single comparison per call so row loops pay no branching beyond the
+    length check; returns the string unchanged when it already fits.
+    """
+    if tail is None:
+        return s[:head] + '...' if len(s) > head else s
+    return f"{s[:head]}...{s[-tail:]}" if len(s) > head + tail + 3 else s
+
+def _dumps_yaml(data) -> str:
+    """Serialize to YAML with the C dumper when libyaml is available.
+
+    PyYAML is imported lazily so table-format commands (the default)
+    never pay its import cost.
+    """
+    import yaml
+    try:
+        from yaml import CSafeDumper as dumper  # libyaml, ~10x faster
+    except ImportError:
+        from yaml import SafeDumper as dumper
+    return yaml.dump(data, Dumper=dumper, default_flow_style=False)
+
+def _syntax(body, lexer):
+    """Build a highlighted Syntax renderable.
+
+    rich.syntax drags in pygments, so import it only when structured
+    output is actually rendered.
+    """
+    from rich.syntax import Syntax
+    return Syntax(body, lexer, theme="monokai", line_numbers=True)
+
+def _print_body(body, lexer):
+    """Print a serialized body: highlighted on a terminal, raw when piped.
+
+    Pygments tokenization is O(size of output) and useless to pipes, so
+    'brale ... --output json | jq' gets the plain string on stdout.
+    """
+    if console.is_terminal:
+        console.print(_syntax(body, lexer))
+    else:
+        sys.stdout.write(body)
+        if not body.endswith('\n'):
+            sys.stdout.write('\n')
+
+# Built once; every account-scoped command prints this same panel when
+# no account can be resolved
+_NO_ACCOUNT_PANEL = Panel.fit(
+    Text.from_markup(
+        "[bold red]No account specified[/bold red]\n"
+        "Use [cyan]--account <id>[/cyan] or set default with "
+        "[cyan]brale config set default_account <id>[/cyan]"
+    ),
+    border_style="red",
+    title="Missing Account"
+)
+
+def _require_account(account):
+    """Resolve the account ID (flag or default) or abort."""
+    account_id = account or _default_account()
+    if not account_id:
+        console.print(_NO_ACCOUNT_PANEL)
+        raise click.Abort()
+    return account_id
+
+def _err(body, title=None):
+    """Build a red error panel, parsing the markup exactly once here."""
+    return Panel.fit(Text.from_markup(body), border_style="red", title=title)
+
+def _require_ok(response, title="API Error"):
+    """Abort with an error panel unless the response is a success.
+
+    Keeps the happy path to a single status check instead of building
+    an error string at every call site.
+    """
+    if not response.ok:
+        console.print(_err(
+            f"[bold red]API Error[/bold red]\nHTTP {response.status_code}: {response.text}",
+            title=title
+        ))
+        raise click.Abort()
+
+def _emit_msgpack(data):
+    """Write MessagePack-encoded data to stdout for machine consumers."""
+    try:
+        import msgpack
+    except ImportError:
+        console.print(Panel.fit(
+            "[bold red]MessagePack output requires the optional msgpack package[/bold red]\n"
+            # Escaped so Rich doesn't eat the extra as a markup tag
+            "Install with: pip install 'brale-cli\\[msgpack]'",
+            border_style="red"
+        ))
+        raise click.Abort()
+    sys.stdout.buffer.write(msgpack.packb(data))
+
+# Field layouts for the payment-instruction panels shared by the
+# transfer and automation commands
+_WIRE_FIELDS = (
+    ("Bank Name", 'bank_name'),
+    ("Bank Address", 'bank_address'),
+    ("Account Number", 'account_number'),
+    ("Routing Number", 'routing_number'),
+    ("Beneficiary Name", 'beneficiary_name'),
+    ("Beneficiary Address", 'beneficiary_address'),
+)
+_ACH_FIELDS = (
+    ("Account Number", 'account_number'),
+    ("Routing Number", 'routing_number'),
+    ("Account Name", 'account_name'),
+)
+
+def _instructions_text(header, info, fields):
+    """Assemble a payment-instructions body without markup parsing.
+
+    The header gets its bold style directly and the field lines are
+    appended as plain text, so rendering skips Rich's markup tokenizer
+    that the old inline f-string templates paid on every print.
+    """
+    text = Text(header, style="bold")
+    text.append("\n")
+    for label, key in fields:
+        text.append(f"\n{label}: {info.get(key, 'N/A')}")
+    return text
+
+def _emit_structured(data, fmt):
+    """Emit data as json/yaml/msgpack; returns False for table format.
+
+    Collapses the identical dispatch block every command carried so
+    call sites reduce to one early-return check before their table
+    rendering.
+    """
+    if fmt == 'json':
+        _print_body(_json.dumps(data, indent=True), "json")
+    elif fmt == 'yaml':
+        _print_body(_dumps_yaml(data), "yaml")
+    elif fmt == 'msgpack':
+        _emit_msgpack(data)
+    else:
+        return False
+    return True
+
+class LazyGroup(click.Group):
+    """Click group that imports subcommand modules on demand.
+
+    Only the invoked subgroup's module is imported, so short commands
+    skip the decorator execution and imports of every other subgroup.
+    """
+
+    _subcommands = ('accounts', 'addresses', 'auth', 'automations', 'config', 'transfers')
+
+    def list_commands(self, ctx):
+        return list(self._subcommands)
+
+    def get_command(self, ctx, name):
+        if name not in self._subcommands:
+            return None
+        module = importlib.import_module('.' + name, __package__)
+        return module.group
+
+@click.group(cls=LazyGroup)
+@click.option('--account', help='Account ID to use (overrides default)')
+@click.option('--output', type=click.Choice(['table', 'json', 'yaml', 'msgpack']), default='table', help='Output format')
+@click.option('--verbose', '-v', is_flag=True, help='Enable verbose logging')
+@click.pass_context
+def main(ctx, account, output, verbose):
+    """Brale CLI - Interact with the Brale API from the command line."""
+    # Ensure that ctx.obj exists and is a dict
+    ctx.ensure_object(dict)
+    
+    # Store global options in context
+    ctx.obj['account'] = account
+    ctx.obj['output'] = output
+    ctx.obj['verbose'] = verbose
+    
+    if verbose:
+        console.print(f"[dim]Brale CLI v{__import__('brale').__version__}[/dim]")
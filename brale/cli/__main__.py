@@ -0,0 +1,6 @@
+"""Allow running the CLI as `python -m brale.cli`."""
+
+from . import main
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,87 @@
+"""Account commands for the Brale CLI."""
+
+import click
+from rich.panel import Panel
+from rich.table import Table
+from . import console, _require_ok, _default_account, _err, _emit_structured
+from .. import _json
+from ..auth import api_client
+
+@click.group('accounts')
+@click.pass_context
+def group(ctx):
+    """Account management commands."""
+    pass
+
+@group.command('list')
+@click.pass_context
+def list_accounts(ctx):
+    """List all accounts."""
+    try:
+        response = api_client.get('/accounts')
+        
+        _require_ok(response, "Error Fetching Accounts")
+            
+        data = _json.loads(response.content)
+        accounts = data.get('accounts', [])
+        
+        output_format = ctx.obj['output']
+        
+        if not _emit_structured(data, output_format):
+            if not accounts:
+                console.print(Panel.fit(
+                    "[dim]No accounts found[/dim]",
+                    border_style="yellow"
+                ))
+                return
+                
+            table = Table(title="Accounts", caption=f"Total: {len(accounts)} account(s)")
+            table.add_column("Account ID", style="cyan")
+            table.add_column("Status", style="green")
+            
+            default_account = _default_account()
+            
+            for account_id in accounts:
+                status = "default" if account_id == default_account else "active"
+                table.add_row(account_id, status)
+            
+            console.print(table)
+            
+    except Exception as e:
+        console.print(_err(
+            f"[bold red]Error[/bold red]\n{e}"
+        ))
+        raise click.Abort()
+
+@group.command()
+@click.argument('account_id')
+@click.pass_context
+def show(ctx, account_id):
+    """Show account details."""
+    try:
+        # For now, we'll just show the account ID since the API doesn't seem to have detailed account info
+        # In a real implementation, you'd call GET /accounts/{account_id} if that endpoint exists
+        
+        output_format = ctx.obj['output']
+        default_account = _default_account()
+        
+        account_info = {
+            'id': account_id,
+            'is_default': account_id == default_account
+        }
+        
+        if not _emit_structured(account_info, output_format):
+            table = Table(title=f"Account Details: {account_id}")
+            table.add_column("Property", style="cyan")
+            table.add_column("Value", style="green")
+            
+            table.add_row("Account ID", account_id)
+            table.add_row("Is Default", "✅ Yes" if account_info['is_default'] else "❌ No")
+            
+            console.print(table)
+            
+    except Exception as e:
+        console.print(_err(
+            f"[bold red]Error[/bold red]\n{e}"
+        ))
+        raise click.Abort()
@@ -0,0 +1,110 @@
+"""Address commands for the Brale CLI."""
+
+import click
+from rich.table import Table
+from rich.text import Text
+from . import console, _require_ok, _trunc, _err, _require_account, _emit_structured
+from .. import _json
+from ..auth import api_client
+
+@click.group('addresses')
+@click.pass_context
+def group(ctx):
+    """Address management commands."""
+    pass
+
+@group.command('list')
+@click.option('--account', help='Account ID (uses default if not specified)')
+@click.pass_context
+def list_addresses(ctx, account):
+    """List all addresses for an account."""
+    try:
+        account_id = _require_account(account)
+        
+        response = api_client.get(f'/accounts/{account_id}/addresses')
+        
+        _require_ok(response, "Error Fetching Addresses")
+            
+        data = _json.loads(response.content)
+        addresses = data.get('addresses', [])
+        
+        output_format = ctx.obj['output']
+        
+        if not _emit_structured(data, output_format):
+            if not addresses:
+                console.print("No addresses found.")
+                return
+                
+            table = Table(title=f"Addresses for Account: {account_id}", caption=f"Total: {len(addresses)} address(es)")
+            table.add_column("ID", style="cyan", max_width=20)
+            table.add_column("Status", style="green")
+            table.add_column("Type", style="blue")
+            table.add_column("Address", style="yellow", max_width=30)
+            table.add_column("Networks", style="magenta", max_width=40)
+            
+            for addr in addresses:
+                # Plain Text cells skip Rich's markup tokenizer; the
+                # column styles still apply.
+                table.add_row(
+                    Text(_trunc(addr['id'], 20)),
+                    Text(addr['status']),
+                    Text(addr['type']),
+                    Text(_trunc(addr.get('address') or 'N/A', 10, 10)),
+                    Text(_trunc(', '.join(addr.get('transfer_types', [])), 32))
+                )
+            
+            console.print(table)
+            
+    except Exception as e:
+        console.print(_err(
+            f"[bold red]Error[/bold red]\n{e}"
+        ))
+        raise click.Abort()
+
+@group.command()
+@click.argument('address_id')
+@click.option('--account', help='Account ID (uses default if not specified)')
+@click.pass_context
+def show(ctx, address_id, account):
+    """Show address details."""
+    try:
+        account_id = _require_account(account)
+        
+        # Get all addresses and find the specific one
+        response = api_client.get(f'/accounts/{account_id}/addresses')
+        
+        _require_ok(response, "Error Fetching Addresses")
+            
+        data = _json.loads(response.content)
+        addresses = data.get('addresses', [])
+        address = next((addr for addr in addresses if addr['id'] == address_id), None)
+        
+        if not address:
+            console.print(_err(
+                f"[bold red]Address not found[/bold red]\nAddress ID: {address_id}",
+                title="Not Found"
+            ))
+            raise click.Abort()
+        
+        output_format = ctx.obj['output']
+        
+        if not _emit_structured(address, output_format):
+            table = Table(title=f"Address Details: {address_id}")
+            table.add_column("Property", style="cyan")
+            table.add_column("Value", style="green")
+            
+            table.add_row("ID", address['id'])
+            table.add_row("Status", address['status'])
+            table.add_row("Type", address['type'])
+            table.add_row("Name", address.get('name') or 'N/A')
+            table.add_row("Address", address.get('address') or 'N/A')
+            table.add_row("Created", address.get('created', 'N/A'))
+            table.add_row("Supported Networks", ', '.join(address.get('transfer_types', [])))
+            
+            console.print(table)
+            
+    except Exception as e:
+        console.print(_err(
+            f"[bold red]Error[/bold red]\n{e}"
+        ))
+        raise click.Abort()
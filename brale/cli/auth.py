@@ -0,0 +1,97 @@
+"""Authentication commands for the Brale CLI."""
+
+import click
+from rich.panel import Panel
+from rich.status import Status
+from . import console, _default_account, _err
+from .. import _json
+from ..config import config as brale_config
+from ..auth import auth as brale_auth, api_client
+
+@click.group('auth')
+@click.pass_context
+def group(ctx):
+    """Authentication commands."""
+    pass
+
+@group.command()
+@click.option('--client-id', help='Client ID (or set BRALE_CLIENT_ID)')
+@click.option('--client-secret', help='Client secret (or set BRALE_SECRET)')
+def login(client_id, client_secret):
+    """Authenticate with Brale API."""
+    # One Status context for both phases; updating the message avoids a
+    # second live-render teardown/setup cycle
+    with Status("[bold green]Authenticating...", console=console) as spinner:
+        try:
+            success = brale_auth.authenticate(client_id, client_secret)
+            if success:
+                console.print(Panel.fit(
+                    "[bold green]Authentication Successful[/bold green]",
+                    border_style="green"
+                ))
+
+        except Exception as e:
+            console.print(_err(
+                f"[bold red]Authentication Failed[/bold red]\n{e}"
+            ))
+            raise click.Abort()
+
+        # Test the authentication by fetching accounts
+        spinner.update("[dim]Verifying access...")
+        try:
+            response = api_client.get('/accounts')
+            if response.status_code == 200:
+                accounts = _json.loads(response.content).get('accounts', [])
+                console.print(f"[dim]Found {len(accounts)} account(s)[/dim]")
+                
+                # Auto-set default account if only one exists
+                if len(accounts) == 1:
+                    brale_config.set_default_account(accounts[0])
+                    _default_account.cache_clear()
+                    console.print(f"[dim]Set default account: [cyan]{accounts[0]}[/cyan][/dim]")
+            else:
+                console.print(f"[yellow]Warning: Couldn't fetch accounts (HTTP {response.status_code})[/yellow]")
+        except Exception as e:
+            console.print(f"[yellow]Warning: Couldn't verify access: {e}[/yellow]")
+
+@group.command()
+def status():
+    """Check authentication status."""
+    if brale_auth.is_authenticated():
+        # Try to get basic info
+        with Status("[dim]Checking access...", console=console):
+            try:
+                response = api_client.get('/accounts')
+                if response.status_code == 200:
+                    accounts = _json.loads(response.content).get('accounts', [])
+                    console.print(Panel.fit(
+                        f"[bold green]Authenticated[/bold green]\nAccess to {len(accounts)} account(s)",
+                        border_style="green",
+                        title="Authentication Status"
+                    ))
+                else:
+                    console.print(Panel.fit(
+                        f"[yellow]Token exists but API returned HTTP {response.status_code}[/yellow]",
+                        border_style="yellow",
+                        title="Authentication Status"
+                    ))
+            except Exception as e:
+                console.print(Panel.fit(
+                    f"[yellow]Token exists but couldn't verify: {e}[/yellow]",
+                    border_style="yellow",
+                    title="Authentication Status"
+                ))
+    else:
+        console.print(_err(
+            "[bold red]Not authenticated[/bold red]\nRun [cyan]brale auth login[/cyan] to authenticate",
+            title="Authentication Status"
+        ))
+
+@group.command()
+def logout():
+    """Clear stored authentication."""
+    brale_auth.logout()
+    console.print(Panel.fit(
+        "[bold blue]Logged out successfully[/bold blue]",
+        border_style="blue"
+    ))
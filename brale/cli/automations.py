@@ -0,0 +1,338 @@
+"""Automation commands for the Brale CLI."""
+
+import os
+
+import click
+from rich.console import Group
+from rich.panel import Panel
+from rich.table import Table
+from rich.status import Status
+from . import console, _require_ok, _dumps_yaml, _syntax, _err, _trunc, _find_compatible_address, _require_account, _emit_structured, _instructions_text, _WIRE_FIELDS
+from .. import _json
+from ..auth import api_client
+
+@click.group('automations')
+@click.pass_context
+def group(ctx):
+    """Automation management commands."""
+    pass
+
+@group.command()
+@click.argument('name')
+@click.option('--token', required=True, help='Token type (usdc, sbc, etc.)')
+@click.option('--network', help='Blockchain network (base, solana, ethereum, etc.)')
+@click.option('--account', help='Account ID (uses default if not specified)')
+@click.pass_context
+def create(ctx, name, token, network, account):
+    """Create a new fiat-to-stablecoin automation."""
+    try:
+        account_id = _require_account(account)
+        
+        # Get addresses to find compatible destination
+        with Status("[dim]Finding compatible address...", console=console):
+            addresses_response = api_client.get(f'/accounts/{account_id}/addresses')
+            
+            _require_ok(addresses_response, "Error Fetching Addresses")
+            
+            addresses_data = _json.loads(addresses_response.content)
+            addresses = addresses_data.get('addresses', [])
+            
+            # Single pass: network lookup, auto-select fallback and the
+            # available-network list all come from one scan
+            compatible_address, network, available_networks = _find_compatible_address(addresses, network)
+
+            if not compatible_address:
+                console.print(_err(
+                    f"[bold red]No compatible address found[/bold red]\nRequested network: {network or 'auto'}\nAvailable networks: {', '.join(available_networks)}",
+                    title="Address Error"
+                ))
+                raise click.Abort()
+        
+        # Create automation request
+        automation_data = {
+            "name": name,
+            "type": "USD",
+            "destination": {
+                "address_id": compatible_address['id'],
+                "value_type": token.upper(),
+                "transfer_type": network
+            }
+        }
+        
+        # Collect the pre-request panels and render them in one pass
+        details = [Panel.fit(
+            f"[bold blue]Creating Automation[/bold blue]\n"
+            f"Name: {name}\n"
+            f"Token: {token.upper()} on {network}\n"
+            f"Address: {compatible_address['id'][:20]}...",
+            border_style="blue",
+            title="Automation Details"
+        )]
+
+        if ctx.obj['output'] in ['json', 'yaml']:
+            if ctx.obj['output'] == 'json':
+                syntax = _syntax(_json.dumps(automation_data, indent=True), "json")
+            else:
+                syntax = _syntax(_dumps_yaml(automation_data), "yaml")
+            details.append(Panel(syntax, title="Request Body"))
+
+        console.print(Group(*details))
+        
+        # Make the API request
+        with Status("[bold green]Creating automation...", console=console):
+            automation_response = api_client.post(
+                f'/accounts/{account_id}/automations',
+                headers={"Idempotency-Key": os.urandom(16).hex()},
+                json=automation_data
+            )
+            
+            _require_ok(automation_response, "Automation Creation Failed")
+        
+        result = _json.loads(automation_response.content)
+        
+        console.print(Panel.fit(
+            f"[bold green]Automation Created Successfully[/bold green]\n"
+            f"Automation ID: [cyan]{result['id']}[/cyan]\n"
+            f"Status: [yellow]{result['status']}[/yellow]",
+            border_style="green",
+            title="Success"
+        ))
+        
+        # Show wire instructions if available - always show for table output
+        if 'wire_instructions' in result:
+            wire_info = result['wire_instructions']
+            instructions_text = _instructions_text(
+                "Customer Wire Instructions:", wire_info, _WIRE_FIELDS
+            )
+
+            if wire_info.get('memo'):
+                instructions_text.append(f"\nMemo: {wire_info['memo']}")
+
+            instructions_text.append(
+                f"\n\nShare these instructions with customers to automatically mint {token.upper()} to your wallet.",
+                style="dim"
+            )
+
+            console.print(Panel(
+                instructions_text,
+                border_style="yellow",
+                title="Customer Instructions"
+            ))
+        
+        if ctx.obj['verbose']:
+            if ctx.obj['output'] == 'json':
+                syntax = _syntax(_json.dumps(result, indent=True), "json")
+                console.print(Panel(syntax, title="Full Response"))
+            elif ctx.obj['output'] == 'yaml':
+                syntax = _syntax(_dumps_yaml(result), "yaml")
+                console.print(Panel(syntax, title="Full Response"))
+                
+    except Exception as e:
+        console.print(_err(
+            f"[bold red]Error[/bold red]\n{e}"
+        ))
+        raise click.Abort()
+
+@group.command('list')
+@click.option('--account', help='Account ID (uses default if not specified)')
+@click.option('--status', help='Filter by status (pending, complete, failed)')
+@click.pass_context
+def list_automations(ctx, account, status):
+    """List all automations for an account."""
+    try:
+        account_id = _require_account(account)
+        
+        with Status("[dim]Fetching automations...", console=console):
+            response = api_client.get(f'/accounts/{account_id}/automations')
+            
+            _require_ok(response, "Error Fetching Automations")
+                
+            data = _json.loads(response.content)
+            automations = data.get('automations', [])
+            
+            # Filter by status if provided
+            if status:
+                automations = [a for a in automations if a.get('status') == status]
+        
+        output_format = ctx.obj['output']
+        
+        if not _emit_structured({'automations': automations} if status else data, output_format):
+            if not automations:
+                console.print(Panel.fit(
+                    "[dim]No automations found[/dim]",
+                    border_style="yellow"
+                ))
+                return
+                
+            table = Table(title=f"Automations for Account: {account_id}", caption=f"Total: {len(automations)} automation(s)")
+            table.add_column("ID", style="cyan")
+            table.add_column("Name", style="blue")
+            table.add_column("Status", style="green")
+            table.add_column("Token", style="yellow")
+            table.add_column("Network", style="magenta")
+            table.add_column("Created", style="dim")
+            
+            for automation in automations:
+                auto_id = automation['id']
+                name = automation.get('name', 'N/A')
+
+                dest = automation.get('destination', {})
+                token = dest.get('value_type', 'N/A')
+                network = dest.get('transfer_type', 'N/A')
+
+                created = automation.get('created_at', 'N/A')
+                # Fixed-shape ISO-8601: slice around the known 'T'
+                if len(created) >= 16 and created[10] == 'T':
+                    created = f"{created[:10]} {created[11:16]}"
+
+                table.add_row(
+                    auto_id,
+                    name,
+                    automation['status'],
+                    token,
+                    network,
+                    created
+                )
+
+            console.print(table)
+
+            # Show wire instructions for each automation that has them
+            for automation in automations:
+                wire_instructions = automation.get('wire_instructions')
+                if wire_instructions:
+                    auto_id = _trunc(automation['id'], 20)
+                    name = automation.get('name', 'N/A')
+                    dest = automation.get('destination', {})
+                    token = dest.get('value_type', 'N/A')
+                    network = dest.get('transfer_type', 'N/A')
+                    
+                    instructions_text = _instructions_text(
+                        f'Wire Instructions for "{name}" ({token} on {network}):',
+                        wire_instructions, _WIRE_FIELDS
+                    )
+
+                    if wire_instructions.get('memo'):
+                        instructions_text.append(f"\nMemo: {wire_instructions['memo']}")
+
+                    console.print(Panel(
+                        instructions_text,
+                        border_style="yellow",
+                        title=f"Customer Instructions - {auto_id}"
+                    ))
+            
+    except Exception as e:
+        console.print(_err(
+            f"[bold red]Error[/bold red]\n{e}"
+        ))
+        raise click.Abort()
+
+@group.command()
+@click.argument('automation_id')
+@click.option('--account', help='Account ID (uses default if not specified)')
+@click.option('--watch', is_flag=True, help='Poll until the automation status settles')
+@click.pass_context
+def show(ctx, automation_id, account, watch):
+    """Show automation details (needs AUTOMATION_ID from 'list')."""
+    try:
+        account_id = _require_account(account)
+        
+        with Status("[dim]Fetching automation details...", console=console):
+            if watch:
+                # Poll with backoff until the automation leaves 'pending'
+                response = api_client.poll_until(
+                    f'/accounts/{account_id}/automations/{automation_id}',
+                    lambda r: r.status_code != 200 or _json.loads(r.content).get('status') != 'pending'
+                )
+            else:
+                response = api_client.get(f'/accounts/{account_id}/automations/{automation_id}')
+
+            _require_ok(response, "Error Fetching Automation")
+                
+            automation = _json.loads(response.content)
+        
+        output_format = ctx.obj['output']
+        
+        if not _emit_structured(automation, output_format):
+            table = Table(title=f"Automation Details: {automation_id}")
+            table.add_column("Property", style="cyan")
+            table.add_column("Value", style="green")
+            
+            table.add_row("ID", automation['id'])
+            table.add_row("Name", automation.get('name', 'N/A'))
+            table.add_row("Status", automation['status'])
+            
+            dest = automation.get('destination', {})
+            table.add_row("Token", dest.get('value_type', 'N/A'))
+            table.add_row("Network", dest.get('transfer_type', 'N/A'))
+            table.add_row("Address ID", dest.get('address_id', 'N/A'))
+            
+            if automation.get('created_at'):
+                table.add_row("Created", automation['created_at'])
+            if automation.get('updated_at'):
+                table.add_row("Updated", automation['updated_at'])
+            
+            console.print(table)
+            
+    except Exception as e:
+        console.print(_err(
+            f"[bold red]Error[/bold red]\n{e}"
+        ))
+        raise click.Abort()
+
+@group.command()
+@click.argument('automation_id')
+@click.option('--account', help='Account ID (uses default if not specified)')
+@click.pass_context
+def instructions(ctx, automation_id, account):
+    """Show wire instructions for automation (needs AUTOMATION_ID from 'list')."""
+    try:
+        account_id = _require_account(account)
+        
+        with Status("[dim]Fetching automation instructions...", console=console):
+            response = api_client.get(f'/accounts/{account_id}/automations/{automation_id}')
+            
+            _require_ok(response, "Error Fetching Automation")
+                
+            automation = _json.loads(response.content)
+        
+        output_format = ctx.obj['output']
+        
+        # Extract instructions
+        wire_instructions = automation.get('wire_instructions')
+        
+        if not wire_instructions:
+            console.print(Panel.fit(
+                "[bold yellow]No wire instructions available[/bold yellow]\nThis automation may still be processing",
+                border_style="yellow",
+                title="No Instructions"
+            ))
+            return
+        
+        if not _emit_structured({'wire_instructions': wire_instructions}, output_format):
+            dest = automation.get('destination', {})
+            token = dest.get('value_type', 'N/A')
+            network = dest.get('transfer_type', 'N/A')
+            
+            instructions_text = _instructions_text(
+                "Customer Wire Instructions:", wire_instructions, _WIRE_FIELDS
+            )
+
+            if wire_instructions.get('memo'):
+                instructions_text.append(f"\nMemo: {wire_instructions['memo']}")
+
+            instructions_text.append(
+                f"\n\nCustomers can send wire transfers to these details to automatically mint {token} on {network} to your wallet.",
+                style="dim"
+            )
+
+            console.print(Panel(
+                instructions_text,
+                border_style="blue",
+                title=f"Customer Instructions - Automation {automation_id[:20]}..."
+            ))
+            
+    except Exception as e:
+        console.print(_err(
+            f"[bold red]Error[/bold red]\n{e}"
+        ))
+        raise click.Abort()
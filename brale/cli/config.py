@@ -0,0 +1,65 @@
+"""Configuration commands for the Brale CLI."""
+
+import click
+from rich.style import Style
+from rich.table import Table
+from . import console, _default_account, _err, _emit_structured
+from ..config import config as brale_config
+
+# Parsed once at import so column construction skips Rich's style parser
+_CYAN = Style(color="cyan")
+_GREEN = Style(color="green")
+
+@click.group('config')
+@click.pass_context
+def group(ctx):
+    """Configuration management commands."""
+    pass
+
+@group.command()
+@click.pass_context
+def show(ctx):
+    """Show current configuration."""
+    output_format = ctx.obj['output']
+    config_data = brale_config.to_dict()
+    
+    if not _emit_structured(config_data, output_format):
+        table = Table(title="Brale CLI Configuration")
+        table.add_column("Setting", style=_CYAN)
+        table.add_column("Value", style=_GREEN)
+        
+        for key, value in config_data.items():
+            table.add_row(key, str(value))
+        
+        console.print(table)
+
+@group.command()
+@click.argument('key')
+@click.argument('value')
+def set(key, value):
+    """Set a configuration value."""
+    try:
+        brale_config.set(key, value)
+        if key == 'default_account':
+            _default_account.cache_clear()
+        # Persisting the value is this command's whole job; flush now so
+        # a failed write aborts here instead of raising from atexit
+        brale_config.flush()
+        console.print(f"[green]Set[/green] [cyan]{key}[/cyan] = [yellow]{value}[/yellow]")
+    except Exception as e:
+        console.print(_err(
+            f"[bold red]Error setting configuration[/bold red]\n{e}"
+        ))
+        raise click.Abort()
+
+@group.command()
+@click.argument('key')
+def get(key):
+    """Get a configuration value."""
+    value = brale_config.get(key)
+    if value is None:
+        console.print(_err(
+            f"[bold red]Configuration key not found[/bold red]\n'{key}' is not set"
+        ))
+        raise click.Abort()
+    console.print(f"[cyan]{key}[/cyan] = [yellow]{value}[/yellow]")
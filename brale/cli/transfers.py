@@ -0,0 +1,419 @@
+"""Transfer commands for the Brale CLI."""
+
+import os
+
+import click
+from rich.console import Group
+from rich.panel import Panel
+from rich.table import Table
+from rich.status import Status
+from rich.text import Text
+from . import console, _require_ok, _dumps_yaml, _syntax, _find_compatible_address, _err, _trunc, _require_account, _emit_structured, _instructions_text, _WIRE_FIELDS, _ACH_FIELDS
+from .. import _json
+from ..auth import api_client
+
+@click.group('transfers')
+@click.pass_context
+def group(ctx):
+    """Transfer management commands."""
+    pass
+
+@group.command()
+@click.option('--from', 'source', required=True, type=click.Choice(['wire', 'ach']), help='Source type')
+@click.option('--to', 'destination', required=True, help='Destination token (usdc, sbc, etc.)')
+@click.option('--network', help='Blockchain network (base, solana, ethereum, etc.)')
+@click.option('--amount', required=True, type=float, help='Transfer amount in USD')
+@click.option('--account', help='Account ID (uses default if not specified)')
+@click.pass_context
+def create(ctx, source, destination, network, amount, account):
+    """Create a new transfer."""
+    try:
+        account_id = _require_account(account)
+        
+        # Get addresses to find compatible destination
+        with Status("[dim]Finding compatible address...", console=console):
+            addresses_response = api_client.get(f'/accounts/{account_id}/addresses')
+            
+            _require_ok(addresses_response, "Error Fetching Addresses")
+            
+            addresses_data = _json.loads(addresses_response.content)
+            addresses = addresses_data.get('addresses', [])
+            
+            # Single pass: network lookup, auto-select fallback and the
+            # available-network list all come from one scan
+            compatible_address, network, available_networks = _find_compatible_address(addresses, network)
+
+            if not compatible_address:
+                console.print(_err(
+                    f"[bold red]No compatible address found[/bold red]\nRequested network: {network or 'auto'}\nAvailable networks: {', '.join(available_networks)}",
+                    title="Address Error"
+                ))
+                raise click.Abort()
+        
+        # Create transfer request
+        transfer_data = {
+            "amount": {"value": str(amount), "currency": "USD"},
+            "source": {"value_type": "USD", "transfer_type": source},
+            "destination": {
+                "address_id": compatible_address['id'],
+                "value_type": destination.upper(),
+                "transfer_type": network
+            }
+        }
+        
+        # Collect the pre-request panels and render them in one pass
+        details = [Panel.fit(
+            f"[bold blue]Creating Transfer[/bold blue]\n"
+            f"Amount: ${amount} USD\n"
+            f"From: {source.upper()}\n"
+            f"To: {destination.upper()} on {network}\n"
+            f"Address: {compatible_address['id'][:20]}...",
+            border_style="blue",
+            title="Transfer Details"
+        )]
+
+        # Serialize once; the same buffer backs the Request Body panel
+        # and the wire payload instead of encoding twice
+        body = _json.dumps(transfer_data, indent=True)
+
+        if ctx.obj['output'] in ['json', 'yaml']:
+            if ctx.obj['output'] == 'json':
+                syntax = _syntax(body, "json")
+            else:
+                syntax = _syntax(_dumps_yaml(transfer_data), "yaml")
+            details.append(Panel(syntax, title="Request Body"))
+
+        console.print(Group(*details))
+
+        # Make the API request
+        with Status("[bold green]Creating transfer...", console=console):
+            transfer_response = api_client.post(
+                f'/accounts/{account_id}/transfers',
+                headers={
+                    "Idempotency-Key": os.urandom(16).hex(),
+                    "Content-Type": "application/json"
+                },
+                data=body
+            )
+            
+            _require_ok(transfer_response, "Transfer Creation Failed")
+        
+        result = _json.loads(transfer_response.content)
+        
+        # Assemble the success output and render it in one pass
+        parts = [Panel.fit(
+            f"[bold green]Transfer Created Successfully[/bold green]\n"
+            f"Transfer ID: [cyan]{result['id']}[/cyan]\n"
+            f"Status: [yellow]{result['status']}[/yellow]",
+            border_style="green",
+            title="Success"
+        )]
+
+        # Show wire instructions if available
+        if 'wire_instructions' in result:
+            wire_info = result['wire_instructions']
+            # Condensed field set for the post-create summary
+            instructions_text = _instructions_text(
+                "Wire Transfer Instructions:", wire_info, (
+                    ("Bank Name", 'bank_name'),
+                    ("Account Number", 'account_number'),
+                    ("Routing Number", 'routing_number'),
+                    ("Beneficiary", 'beneficiary_name'),
+                )
+            )
+
+            parts.append(Panel(
+                instructions_text,
+                border_style="yellow",
+                title="Wire Instructions"
+            ))
+
+        if ctx.obj['verbose']:
+            if ctx.obj['output'] == 'json':
+                syntax = _syntax(_json.dumps(result, indent=True), "json")
+                parts.append(Panel(syntax, title="Full Response"))
+            elif ctx.obj['output'] == 'yaml':
+                syntax = _syntax(_dumps_yaml(result), "yaml")
+                parts.append(Panel(syntax, title="Full Response"))
+
+        console.print(Group(*parts))
+                
+    except Exception as e:
+        console.print(_err(
+            f"[bold red]Error[/bold red]\n{e}"
+        ))
+        raise click.Abort()
+
+@group.command('list')
+@click.option('--account', help='Account ID (uses default if not specified)')
+@click.option('--status', help='Filter by status (pending, processing, completed, failed)')
+@click.option('--show-instructions', is_flag=True, help='Show wire/ACH instructions for each transfer (makes additional API calls)')
+@click.pass_context
+def list_transfers(ctx, account, status, show_instructions):
+    """List all transfers for an account."""
+    try:
+        account_id = _require_account(account)
+        
+        with Status("[dim]Fetching transfers...", console=console):
+            response = api_client.get(f'/accounts/{account_id}/transfers')
+            
+            _require_ok(response, "Error Fetching Transfers")
+                
+            data = _json.loads(response.content)
+            transfers = data.get('transfers', [])
+            
+            # Filter by status if provided
+            if status:
+                transfers = [t for t in transfers if t.get('status') == status]
+        
+        output_format = ctx.obj['output']
+        
+        if not _emit_structured({'transfers': transfers} if status else data, output_format):
+            if not transfers:
+                console.print(Panel.fit(
+                    "[dim]No transfers found[/dim]",
+                    border_style="yellow"
+                ))
+                return
+                
+            table = Table(title=f"Transfers for Account: {account_id}", caption=f"Total: {len(transfers)} transfer(s)")
+            table.add_column("ID", style="cyan")
+            table.add_column("Status", style="green")
+            table.add_column("Amount", style="yellow")
+            table.add_column("From", style="blue")
+            table.add_column("To", style="magenta")
+            table.add_column("Created", style="dim")
+            
+            # Build each row in one pass with the nested dicts fetched
+            # once per transfer; plain Text cells skip Rich's markup
+            # tokenizer and the column styles still apply.
+            def _row(transfer):
+                amount = transfer.get('amount', {})
+                source = transfer.get('source', {})
+                dest = transfer.get('destination', {})
+                created = transfer.get('created_at', 'N/A')
+                # ISO-8601 has a fixed shape, so slice around the known
+                # 'T' instead of scanning with str.replace
+                if len(created) >= 16 and created[10] == 'T':
+                    created = f"{created[:10]} {created[11:16]}"
+                return (
+                    Text(transfer['id']),
+                    Text(transfer['status']),
+                    Text(f"${amount.get('value', 'N/A')} {amount.get('currency', '')}"),
+                    Text(f"{source.get('value_type', 'N/A')} ({source.get('transfer_type', 'N/A')})"),
+                    Text(f"{dest.get('value_type', 'N/A')} ({dest.get('transfer_type', 'N/A')})"),
+                    Text(created)
+                )
+
+            for row in map(_row, transfers):
+                table.add_row(*row)
+            
+            console.print(table)
+            
+            # Show wire/ACH instructions if requested
+            if show_instructions:
+                console.print(f"\n[dim]Fetching instructions for {len(transfers)} transfer(s)...[/dim]")
+
+                # The per-transfer detail fetches are independent, so issue
+                # them concurrently instead of paying one round-trip each.
+                from concurrent.futures import ThreadPoolExecutor
+
+                def fetch_detail(transfer_id):
+                    return api_client.get(f'/accounts/{account_id}/transfers/{transfer_id}')
+
+                with ThreadPoolExecutor(max_workers=8) as executor:
+                    detail_futures = [executor.submit(fetch_detail, t['id']) for t in transfers]
+
+                for transfer, detail_future in zip(transfers, detail_futures):
+                    transfer_id = transfer['id']
+
+                    try:
+                        detail_response = detail_future.result()
+                        if detail_response.status_code == 200:
+                            detailed_transfer = _json.loads(detail_response.content)
+
+                            # Extract instructions
+                            wire_instructions = detailed_transfer.get('wire_instructions')
+                            ach_instructions = detailed_transfer.get('ach_instructions')
+                            
+                            if wire_instructions or ach_instructions:
+                                short_id = _trunc(transfer_id, 20)
+                                amount = transfer.get('amount', {})
+                                amount_str = f"${amount.get('value', 'N/A')} {amount.get('currency', '')}"
+                                
+                                if wire_instructions:
+                                    wire_text = _instructions_text(
+                                        f"Wire Instructions for Transfer {short_id} ({amount_str}):",
+                                        wire_instructions, _WIRE_FIELDS
+                                    )
+                                    if wire_instructions.get('memo'):
+                                        wire_text.append(f"\nMemo: {wire_instructions['memo']}")
+
+                                    console.print(Panel(
+                                        wire_text,
+                                        border_style="blue",
+                                        title=f"Wire Instructions - {short_id}"
+                                    ))
+
+                                if ach_instructions:
+                                    ach_text = _instructions_text(
+                                        f"ACH Instructions for Transfer {short_id} ({amount_str}):",
+                                        ach_instructions, _ACH_FIELDS
+                                    )
+
+                                    console.print(Panel(
+                                        ach_text,
+                                        border_style="green",
+                                        title=f"ACH Instructions - {short_id}"
+                                    ))
+                    
+                    except Exception as detail_error:
+                        if ctx.obj['verbose']:
+                            console.print(f"[dim yellow]Warning: Couldn't fetch instructions for {transfer_id[:20]}...: {detail_error}[/dim yellow]")
+            
+    except Exception as e:
+        console.print(_err(
+            f"[bold red]Error[/bold red]\n{e}"
+        ))
+        raise click.Abort()
+
+@group.command()
+@click.argument('transfer_ids', nargs=-1, required=True)
+@click.option('--account', help='Account ID (uses default if not specified)')
+@click.pass_context
+def show(ctx, transfer_ids, account):
+    """Show transfer details (accepts one or more TRANSFER_IDs from 'list')."""
+    try:
+        account_id = _require_account(account)
+
+        with Status("[dim]Fetching transfer details...", console=console):
+            if len(transfer_ids) == 1:
+                responses = [api_client.get(f'/accounts/{account_id}/transfers/{transfer_ids[0]}')]
+            else:
+                # Independent lookups, so issue them concurrently on the
+                # pooled session; map() keeps the argument order
+                from concurrent.futures import ThreadPoolExecutor
+
+                with ThreadPoolExecutor(max_workers=8) as executor:
+                    responses = list(executor.map(
+                        lambda tid: api_client.get(f'/accounts/{account_id}/transfers/{tid}'),
+                        transfer_ids
+                    ))
+
+            transfers = []
+            for response in responses:
+                _require_ok(response, "Error Fetching Transfer")
+                transfers.append(_json.loads(response.content))
+
+        output_format = ctx.obj['output']
+
+        # Single-ID output keeps its original shape; batches wrap a list
+        payload = transfers[0] if len(transfers) == 1 else {'transfers': transfers}
+        if not _emit_structured(payload, output_format):
+            for transfer in transfers:
+                table = Table(title=f"Transfer Details: {transfer['id']}")
+                table.add_column("Property", style="cyan")
+                table.add_column("Value", style="green")
+
+                table.add_row("ID", transfer['id'])
+                table.add_row("Status", transfer['status'])
+
+                amount = transfer.get('amount', {})
+                table.add_row("Amount", f"${amount.get('value', 'N/A')} {amount.get('currency', '')}")
+
+                source = transfer.get('source', {})
+                table.add_row("Source", f"{source.get('value_type', 'N/A')} via {source.get('transfer_type', 'N/A')}")
+
+                dest = transfer.get('destination', {})
+                table.add_row("Destination", f"{dest.get('value_type', 'N/A')} via {dest.get('transfer_type', 'N/A')}")
+                table.add_row("Address ID", dest.get('address_id', 'N/A'))
+
+                table.add_row("Created", transfer.get('created_at', 'N/A'))
+                table.add_row("Updated", transfer.get('updated_at', 'N/A'))
+
+                if transfer.get('note'):
+                    table.add_row("Note", transfer['note'])
+
+                console.print(table)
+
+    except Exception as e:
+        console.print(_err(
+            f"[bold red]Error[/bold red]\n{e}"
+        ))
+        raise click.Abort()
+
+@group.command()
+@click.argument('transfer_id')
+@click.option('--account', help='Account ID (uses default if not specified)')
+@click.pass_context
+def instructions(ctx, transfer_id, account):
+    """Show wire/ACH instructions (needs TRANSFER_ID from 'list')."""
+    try:
+        account_id = _require_account(account)
+        
+        with Status("[dim]Fetching transfer instructions...", console=console):
+            response = api_client.get(f'/accounts/{account_id}/transfers/{transfer_id}')
+            
+            _require_ok(response, "Error Fetching Transfer")
+                
+            transfer = _json.loads(response.content)
+        
+        # Debug: Show full API response if verbose (raw body, so we don't
+        # pay a second serialization of JSON that just arrived as text)
+        if ctx.obj.get('verbose'):
+            console.print(Panel(
+                f"[bold cyan]DEBUG: Full API Response[/bold cyan]\n{response.text}",
+                border_style="cyan",
+                title="Debug Info"
+            ))
+        
+        output_format = ctx.obj['output']
+        
+        # Extract instructions
+        wire_instructions = transfer.get('wire_instructions')
+        ach_instructions = transfer.get('ach_instructions')
+        
+        if not wire_instructions and not ach_instructions:
+            console.print(Panel.fit(
+                "[bold yellow]No payment instructions available[/bold yellow]\nThis transfer may not require manual funding",
+                border_style="yellow",
+                title="No Instructions"
+            ))
+            return
+        
+        instructions_data = {}
+        if wire_instructions:
+            instructions_data['wire_instructions'] = wire_instructions
+        if ach_instructions:
+            instructions_data['ach_instructions'] = ach_instructions
+
+        if not _emit_structured(instructions_data, output_format):
+            if wire_instructions:
+                instructions_text = _instructions_text(
+                    "Wire Transfer Instructions:", wire_instructions, _WIRE_FIELDS
+                )
+                if wire_instructions.get('memo'):
+                    instructions_text.append(f"\nMemo: {wire_instructions['memo']}")
+
+                console.print(Panel(
+                    instructions_text,
+                    border_style="blue",
+                    title=f"Wire Instructions - Transfer {transfer_id[:20]}..."
+                ))
+
+            if ach_instructions:
+                ach_text = _instructions_text(
+                    "ACH Transfer Instructions:", ach_instructions, _ACH_FIELDS
+                )
+
+                console.print(Panel(
+                    ach_text,
+                    border_style="green",
+                    title=f"ACH Instructions - Transfer {transfer_id[:20]}..."
+                ))
+            
+    except Exception as e:
+        console.print(_err(
+            f"[bold red]Error[/bold red]\n{e}"
+        ))
+        raise click.Abort()
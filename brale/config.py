@@ -1,11 +1,11 @@
 """Configuration management for Brale CLI."""
 
+import atexit
 import os
-import json
-import yaml
 from pathlib import Path
 from typing import Optional, Dict, Any
-from dotenv import load_dotenv
+
+from . import _json
 
 class BraleConfig:
     """Configuration manager for Brale CLI."""
@@ -15,18 +15,35 @@ class BraleConfig:
         self.config_file = self.config_dir / 'config.yaml'
         self.credentials_file = self.config_dir / 'credentials.json'
         
-        # Load environment variables
-        load_dotenv()
-        
+        # .env loading is deferred until credentials are actually read
+        self._dotenv_loaded = False
+
         # Ensure config directory exists
         self.config_dir.mkdir(exist_ok=True)
         
         # Load configuration
         self._config = self._load_config()
         self._credentials = self._load_credentials()
+
+        # Mutations only mark these dirty; files are written once at
+        # process exit (or on an explicit flush) instead of per set()
+        self._config_dirty = False
+        self._credentials_dirty = False
+        atexit.register(self.flush)
+
+        # Hot keys read on nearly every command; kept as attributes so
+        # the getters are plain reads, refreshed by set()
+        self._default_account = self._config.get('default_account')
+        self._api_base = self._config.get('api_base_url', 'https://api.brale.xyz')
+        self._auth_base = self._config.get('auth_base_url', 'https://auth.brale.xyz')
     
     def _load_config(self) -> Dict[str, Any]:
-        """Load configuration from file."""
+        """Load configuration from file.
+
+        A pickled snapshot keyed by the YAML file's mtime sits next to
+        it; warm starts unpickle instead of paying yaml.safe_load, and
+        any edit to config.yaml (mtime change) invalidates the snapshot.
+        """
         if not self.config_file.exists():
             return {
                 'default_account': None,
@@ -34,12 +51,34 @@ class BraleConfig:
                 'api_base_url': 'https://api.brale.xyz',
                 'auth_base_url': 'https://auth.brale.xyz'
             }
-        
+
+        import pickle
+        snapshot_file = self.config_file.with_suffix('.yaml.pkl')
+        try:
+            mtime = self.config_file.stat().st_mtime_ns
+        except OSError:
+            return {}
+        try:
+            snapshot_mtime, snapshot = pickle.loads(snapshot_file.read_bytes())
+            if snapshot_mtime == mtime:
+                return snapshot
+        except Exception:
+            pass
+
+        import yaml
         try:
             with open(self.config_file, 'r') as f:
-                return yaml.safe_load(f) or {}
+                loaded = yaml.safe_load(f) or {}
         except Exception:
             return {}
+
+        try:
+            snapshot_file.write_bytes(
+                pickle.dumps((mtime, loaded), pickle.HIGHEST_PROTOCOL)
+            )
+        except Exception:
+            pass  # snapshot is an optimization, never a requirement
+        return loaded
     
     def _load_credentials(self) -> Dict[str, Any]:
         """Load credentials from file."""
@@ -47,51 +86,84 @@ class BraleConfig:
             return {}
         
         try:
-            with open(self.credentials_file, 'r') as f:
-                return json.load(f)
+            return _json.loads(self.credentials_file.read_bytes())
         except Exception:
             return {}
     
     def _save_config(self):
-        """Save configuration to file."""
+        """Save configuration to file (atomic write-then-rename)."""
+        import yaml
         try:
-            with open(self.config_file, 'w') as f:
-                yaml.dump(self._config, f, default_flow_style=False)
+            tmp = self.config_file.with_suffix('.yaml.tmp')
+            with open(tmp, 'w') as f:
+                # block style is already PyYAML's default
+                yaml.dump(self._config, f)
+            os.replace(tmp, self.config_file)
         except Exception as e:
             raise RuntimeError(f"Failed to save config: {e}")
-    
+
     def _save_credentials(self):
-        """Save credentials to file."""
+        """Save credentials to file (atomic write-then-rename)."""
         try:
-            with open(self.credentials_file, 'w') as f:
-                json.dump(self._credentials, f, indent=2)
-            # Set restrictive permissions on credentials file
-            os.chmod(self.credentials_file, 0o600)
+            tmp = self.credentials_file.with_suffix('.json.tmp')
+            # Compact output; the file is machine-read only
+            tmp.write_text(_json.dumps(self._credentials))
+            # Set restrictive permissions before the file becomes visible
+            os.chmod(tmp, 0o600)
+            os.replace(tmp, self.credentials_file)
         except Exception as e:
             raise RuntimeError(f"Failed to save credentials: {e}")
-    
+
+    def flush(self):
+        """Write any pending config/credential changes to disk."""
+        if self._config_dirty:
+            self._save_config()
+            self._config_dirty = False
+        if self._credentials_dirty:
+            self._save_credentials()
+            self._credentials_dirty = False
+
     def get(self, key: str, default: Any = None) -> Any:
         """Get configuration value."""
         return self._config.get(key, default)
-    
+
     def set(self, key: str, value: Any):
         """Set configuration value."""
         self._config[key] = value
-        self._save_config()
-    
+        self._config_dirty = True
+        if key == 'default_account':
+            self._default_account = value
+        elif key == 'api_base_url':
+            self._api_base = value
+        elif key == 'auth_base_url':
+            self._auth_base = value
+
     def get_credential(self, key: str, default: Any = None) -> Any:
         """Get credential value."""
         return self._credentials.get(key, default)
-    
+
     def set_credential(self, key: str, value: Any):
         """Set credential value."""
         self._credentials[key] = value
-        self._save_credentials()
-    
+        self._credentials_dirty = True
+    
+    def _load_env(self):
+        """Load .env variables on first use (dotenv walks the filesystem)."""
+        if not self._dotenv_loaded:
+            from dotenv import load_dotenv
+            load_dotenv()
+            self._dotenv_loaded = True
+
     def get_client_credentials(self) -> tuple[Optional[str], Optional[str]]:
         """Get client ID and secret from environment or config."""
-        client_id = os.getenv('BRALE_CLIENT_ID') or self.get_credential('client_id')
-        client_secret = os.getenv('BRALE_SECRET') or self.get_credential('client_secret')
+        # Live environment first; the .env file walk only runs when a
+        # variable is actually missing
+        client_id = os.environ.get('BRALE_CLIENT_ID')
+        client_secret = os.environ.get('BRALE_SECRET')
+        if not client_id or not client_secret:
+            self._load_env()
+            client_id = client_id or os.getenv('BRALE_CLIENT_ID') or self.get_credential('client_id')
+            client_secret = client_secret or os.getenv('BRALE_SECRET') or self.get_credential('client_secret')
         return client_id, client_secret
     
     def get_access_token(self) -> Optional[str]:
@@ -108,11 +180,11 @@ class BraleConfig:
         """Clear stored access token."""
         self._credentials.pop('access_token', None)
         self._credentials.pop('token_expires_at', None)
-        self._save_credentials()
+        self._credentials_dirty = True
     
     def get_default_account(self) -> Optional[str]:
         """Get default account ID."""
-        return self.get('default_account')
+        return self._default_account
     
     def set_default_account(self, account_id: str):
         """Set default account ID."""
@@ -120,11 +192,11 @@ class BraleConfig:
     
     def get_api_base_url(self) -> str:
         """Get API base URL."""
-        return self.get('api_base_url', 'https://api.brale.xyz')
-    
+        return self._api_base
+
     def get_auth_base_url(self) -> str:
         """Get auth base URL."""
-        return self.get('auth_base_url', 'https://auth.brale.xyz')
+        return self._auth_base
     
     def to_dict(self) -> Dict[str, Any]:
         """Return configuration as dictionary (excluding sensitive data)."""